@@ -1,19 +1,53 @@
 from amadeus import Client, ResponseError
+from amadeus.client.access_token import AccessToken
 from dotenv import load_dotenv
 import os
 from fastapi import HTTPException
 
+from app.config.cache_config import cache, ACCESS_TOKEN_TTL
+
 load_dotenv()
 
+ACCESS_TOKEN_CACHE_KEY = "amadeus:access_token"
+
+class SharedAccessToken(AccessToken):
+    """Amadeus access token shared between processes through the cache.
+
+    Before falling back to its own OAuth request, a worker adopts any newer
+    token already fetched by another worker, and publishes the tokens it
+    fetches itself.
+    """
+
+    def _bearer_token(self):
+        shared = cache.get(ACCESS_TOKEN_CACHE_KEY)
+        if shared and shared["expires_at"] > self.expires_at:
+            self.access_token = shared["access_token"]
+            self.expires_at = shared["expires_at"]
+
+        previous_token = self.access_token
+        bearer_token = super()._bearer_token()
+        if self.access_token != previous_token:
+            cache.set(
+                ACCESS_TOKEN_CACHE_KEY,
+                {"access_token": self.access_token, "expires_at": self.expires_at},
+                ACCESS_TOKEN_TTL,
+            )
+        return bearer_token
+
 amadeus = Client(
     client_id=os.getenv('AMADEUS_CLIENT_ID'),
     client_secret=os.getenv('AMADEUS_CLIENT_SECRET'),
     hostname='test'
 )
+amadeus.access_token = SharedAccessToken(amadeus)
 
 def handle_amadeus_error(error: ResponseError):
     """Handle Amadeus API errors and convert them to FastAPI HTTP exceptions"""
     if error.response.status_code == 401:
+        # Drop the rejected token, shared and local, so the next call fetches a new one
+        cache.delete(ACCESS_TOKEN_CACHE_KEY)
+        amadeus.access_token.access_token = None
+        amadeus.access_token.expires_at = 0
         raise HTTPException(status_code=401, detail="Authentication failed with Amadeus API")
     elif error.response.status_code == 404:
         raise HTTPException(status_code=404, detail="Resource not found in Amadeus API")
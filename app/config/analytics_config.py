@@ -0,0 +1,24 @@
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# Number of popular (origin, destination, date offset, adults) routes kept warm
+ANALYTICS_TOP_K = int(os.getenv('ANALYTICS_TOP_K', '50'))
+
+# Routes persisted per warmed route, so new routes can build up a count
+ANALYTICS_CANDIDATE_FACTOR = int(os.getenv('ANALYTICS_CANDIDATE_FACTOR', '4'))
+
+# Distinct routes counted in memory between two flushes to the database
+ANALYTICS_TRACKER_CAPACITY = int(os.getenv('ANALYTICS_TRACKER_CAPACITY', '1000'))
+
+# Factor applied to persisted counts on every warm cycle so old trends fade out
+ANALYTICS_DECAY = float(os.getenv('ANALYTICS_DECAY', '0.95'))
+
+# Seconds between warm cycles
+WARM_INTERVAL = int(os.getenv('WARM_INTERVAL', '300'))
+
+# Upstream flight search calls per hour allowed by the Amadeus quota, and the
+# share of it the warmer may spend
+WARM_UPSTREAM_QUOTA = int(os.getenv('WARM_UPSTREAM_QUOTA', '360'))
+WARM_QUOTA_SHARE = float(os.getenv('WARM_QUOTA_SHARE', '0.2'))
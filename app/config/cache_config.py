@@ -0,0 +1,22 @@
+from dotenv import load_dotenv
+import os
+
+from app.services.cache_service import create_cache
+
+load_dotenv()
+
+# "sqlite" shares the cache between uvicorn workers on one host, "redis" between
+# nodes, "memory" keeps a private cache per process.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'sqlite')
+CACHE_URL = os.getenv('CACHE_URL', './cache.db')
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '5000'))
+
+# TTLs in seconds for cached Amadeus responses
+LOCATIONS_TTL = int(os.getenv('CACHE_LOCATIONS_TTL', '86400'))
+DESTINATIONS_TTL = int(os.getenv('CACHE_DESTINATIONS_TTL', '86400'))
+FLIGHT_OFFERS_TTL = int(os.getenv('CACHE_FLIGHT_OFFERS_TTL', '900'))
+
+# Amadeus tokens live for ~30 minutes; share them for slightly less than that
+ACCESS_TOKEN_TTL = int(os.getenv('CACHE_ACCESS_TOKEN_TTL', '1500'))
+
+cache = create_cache(CACHE_BACKEND, CACHE_URL, CACHE_MAX_ENTRIES)
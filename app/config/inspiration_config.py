@@ -0,0 +1,25 @@
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# How often a materialized (origin, month) table is rebuilt, in seconds
+INSPIRATION_REFRESH_INTERVAL = int(os.getenv('INSPIRATION_REFRESH_INTERVAL', '21600'))
+
+# Days between sampled departure dates within the month
+INSPIRATION_DATE_STEP = int(os.getenv('INSPIRATION_DATE_STEP', '7'))
+
+# Number of concurrent Amadeus flight searches during a refresh
+INSPIRATION_MAX_WORKERS = int(os.getenv('INSPIRATION_MAX_WORKERS', '8'))
+
+# Share of failed flight searches above which a refresh is discarded
+INSPIRATION_MAX_FAILURE_SHARE = float(os.getenv('INSPIRATION_MAX_FAILURE_SHARE', '0.2'))
+
+# Seconds between background checks for tables that go stale before the next check
+INSPIRATION_REFRESH_CHECK_INTERVAL = int(os.getenv('INSPIRATION_REFRESH_CHECK_INTERVAL', '1800'))
+
+# Seconds a worker may spend rebuilding one (origin, month) before others may retry
+INSPIRATION_REBUILD_LEASE = int(os.getenv('INSPIRATION_REBUILD_LEASE', '600'))
+
+# Upper bound on the flight searches of one rebuild, to protect the upstream quota
+INSPIRATION_MAX_SEARCHES = int(os.getenv('INSPIRATION_MAX_SEARCHES', '300'))
@@ -1,8 +1,15 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 
-from .database import engine, Base
+from . import models  # noqa: F401 - registers tables on Base
+from .config.analytics_config import WARM_INTERVAL
+from .config.inspiration_config import INSPIRATION_REFRESH_CHECK_INTERVAL
+from .database import engine, Base, SessionLocal
 from .routers import flight_router
+from .services import analytics_service, inspiration_service
 from .utils.logger import get_logger
 from mcp_server import mcp
 
@@ -13,9 +20,53 @@ logger = get_logger(__name__)
 Base.metadata.create_all(bind=engine)
 logger.info("Database tables created successfully")
 
+def refresh_inspirations():
+    db = SessionLocal()
+    try:
+        refreshed = inspiration_service.refresh_stale_inspirations(db)
+        logger.info("Refreshed %d inspiration tables", refreshed)
+    finally:
+        db.close()
+
+async def refresh_inspirations_periodically():
+    while True:
+        await asyncio.sleep(INSPIRATION_REFRESH_CHECK_INTERVAL)
+        try:
+            await asyncio.to_thread(refresh_inspirations)
+        except Exception:
+            logger.exception("Inspiration refresh failed")
+
+def warm_popular_routes():
+    db = SessionLocal()
+    try:
+        warmed = analytics_service.warm_popular_routes(db)
+        logger.info("Warmed %d popular routes", warmed)
+    finally:
+        db.close()
+
+async def warm_popular_routes_periodically():
+    # Warm right away so a fresh instance starts from the persisted popular routes
+    while True:
+        try:
+            await asyncio.to_thread(warm_popular_routes)
+        except Exception:
+            logger.exception("Popular route warming failed")
+        await asyncio.sleep(WARM_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refresher = asyncio.create_task(refresh_inspirations_periodically())
+    logger.info("Inspiration refresher started")
+    warmer = asyncio.create_task(warm_popular_routes_periodically())
+    logger.info("Popular route warmer started")
+    yield
+    refresher.cancel()
+    warmer.cancel()
+
 app = FastAPI(
     title="Bhindi's Flight Booking API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Include routers
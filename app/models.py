@@ -0,0 +1,56 @@
+from sqlalchemy import Column, Date, DateTime, Float, Index, Integer, String
+
+from .database import Base
+
+class InspirationFare(Base):
+    """Cheapest known fare from an origin to one destination within a month.
+
+    Rows are materialized per (origin, month) by the inspiration service and
+    replaced as a whole on every refresh.
+    """
+    __tablename__ = "inspiration_fares"
+
+    id = Column(Integer, primary_key=True)
+    origin = Column(String(3), nullable=False)
+    month = Column(String(7), nullable=False)  # YYYY-MM
+    destination = Column(String(3), nullable=False)
+    destination_name = Column(String)
+    departure_date = Column(Date, nullable=False)
+    price = Column(Float, nullable=False)
+    currency = Column(String(3), nullable=False)
+    refreshed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_inspiration_fares_origin_month_price", "origin", "month", "price"),
+    )
+
+class InspirationRefresh(Base):
+    """When the inspiration fares of an (origin, month) were last materialized.
+
+    Kept separately from the fares so a refresh that found no fares is
+    remembered too.
+    """
+    __tablename__ = "inspiration_refreshes"
+
+    origin = Column(String(3), primary_key=True)
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    refreshed_at = Column(DateTime, nullable=False)
+
+class PopularRoute(Base):
+    """Decayed search count of a route, used to pre-warm the flight offers cache.
+
+    The date offset is the number of days between the search and the
+    departure date, so a route stays meaningful as days go by.
+    """
+    __tablename__ = "popular_routes"
+
+    origin = Column(String(3), primary_key=True)
+    destination = Column(String(3), primary_key=True)
+    date_offset = Column(Integer, primary_key=True)
+    adults = Column(Integer, primary_key=True)
+    count = Column(Float, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_popular_routes_count", "count"),
+    )
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from datetime import datetime
 from typing import List, Literal, Optional, Dict, Any
+from sqlalchemy.orm import Session
 
-from app.services import flight_service
+from app.database import get_db
+from app.services import analytics_service, flight_service, inspiration_service
 from app.utils.logger import get_logger
 
 # Initialize logger
@@ -58,6 +60,47 @@ def get_flight_destinations(
     """
     return flight_service.get_flight_destinations(origin)
 
+@router.get(
+    "/inspiration",
+    response_model=List[Dict[str, Any]],
+    summary="Get the cheapest destinations from an origin",
+    response_description="Direct destinations with their cheapest fare in the month",
+)
+def get_cheapest_destinations(
+    origin: str = Query(..., description="IATA code of the origin airport (e.g., 'BOM' for Mumbai)"),
+    month: Optional[str] = Query(
+        None,
+        pattern=r"^\d{4}-\d{2}$",
+        description="Month to search (YYYY-MM). Defaults to next month",
+    ),
+    limit: int = Query(default=20, ge=1, le=100, description="Maximum number of destinations"),
+    db: Session = Depends(get_db),
+):
+    """Get the cheapest direct destinations from an origin airport within a month.
+
+    Combines the direct destinations of the origin with low-price flight searches
+    across the month, and returns one fare per destination sorted by price. Prices
+    are for one adult. Results are served from a periodically refreshed table, so
+    they may be a few hours old; use `/flights/search` for live offers.
+
+    Raises:
+        HTTPException(400): If the month is not a valid YYYY-MM month or is in the past
+        HTTPException(503): If the fares could not be fetched, or are being fetched by
+            another request, and none are stored yet
+    """
+    origin = origin.upper()
+    month = month or inspiration_service.next_month()
+    try:
+        inspiration_service.parse_month(month)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Month must be a valid YYYY-MM month, not before the current one",
+        )
+
+    logger.info("Getting cheapest destinations from %s in %s", origin, month)
+    return inspiration_service.get_cheapest_destinations(db, origin, month, limit)
+
 @router.get(
     "/search",
     response_model=List[Dict[str, Any]],
@@ -96,6 +139,7 @@ def search_flights(
         )
 
     logger.info("Searching flights from %s to %s on %s", origin, destination, departure_date)
+    analytics_service.record_search(origin, destination, departure_date, adults)
     flights = flight_service.search_flights(
         origin=origin,
         destination=destination,
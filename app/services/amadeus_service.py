@@ -1,11 +1,26 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from app.config.amadeus_config import amadeus, handle_amadeus_error
+from app.config.cache_config import cache, LOCATIONS_TTL, DESTINATIONS_TTL, FLIGHT_OFFERS_TTL
+from app.services.cache_service import make_key
 from amadeus import ResponseError, Location
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _cached(key: str, ttl: int, fetch: Callable[[], Any], refresh: bool = False) -> Any:
+    """Return the cached value for key, calling fetch and caching its result on a miss.
+
+    With refresh=True the cached value is ignored and replaced.
+    """
+    cached = None if refresh else cache.get(key)
+    if cached is not None:
+        logger.debug("Cache hit for %s", key)
+        return cached
+    value = fetch()
+    cache.set(key, value, ttl)
+    return value
+
 def search_airports_cities(
     keyword: str,
     subtype: Optional[str] = None
@@ -23,11 +38,12 @@ def search_airports_cities(
         List of location dictionaries
     """
     try:
-        response = amadeus.reference_data.locations.get(
-            keyword=keyword,
-            subType=subtype or Location.ANY
+        search_params = {"keyword": keyword, "subType": subtype or Location.ANY}
+        return _cached(
+            make_key("locations", search_params),
+            LOCATIONS_TTL,
+            lambda: amadeus.reference_data.locations.get(**search_params).data,
         )
-        return response.data
     except ResponseError as error:
         handle_amadeus_error(error)
         return []
@@ -42,19 +58,45 @@ def get_flight_destinations(origin: str) -> List[Dict[str, Any]]:
         List of destination dictionaries
     """
     try:
-        response = amadeus.airport.direct_destinations.get(departureAirportCode=origin)
-        return response.data
+        return _cached(
+            make_key("direct_destinations", {"departureAirportCode": origin}),
+            DESTINATIONS_TTL,
+            lambda: amadeus.airport.direct_destinations.get(departureAirportCode=origin).data,
+        )
     except ResponseError as error:
         handle_amadeus_error(error)
         return []
 
+def _flight_offers_key(
+    origin: str,
+    destination: str,
+    departure_date: datetime,
+    adults: int,
+    currency_code: str,
+    max_results: int,
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the Flight Offers Search parameters and their cache key.
+
+    IATA codes are upper-cased so "bom" and "BOM" share one cache entry.
+    """
+    search_params = {
+        "originLocationCode": origin.upper(),
+        "destinationLocationCode": destination.upper(),
+        "departureDate": departure_date.strftime("%Y-%m-%d"),
+        "adults": adults,
+        "currencyCode": currency_code,
+        "max": max_results,
+    }
+    return make_key("flight_offers", search_params), search_params
+
 def search_flights(
     origin: str,
     destination: str,
     departure_date: datetime,
     adults: int,
     currency_code: str = "INR",
-    max_results: int = 20
+    max_results: int = 20,
+    refresh: bool = False
 ) -> List[Dict[str, Any]]:
     """Search for available flights using the Amadeus Flight Offers Search API.
 
@@ -65,29 +107,46 @@ def search_flights(
         adults: Number of adult passengers (1-9)
         currency_code: Currency for pricing (default: "INR")
         max_results: Maximum number of results to return (default: 20)
+        refresh: Bypass the cache and store a fresh response (default: False)
 
     Returns:
         List of flight offer dictionaries
     """
     try:
-        departure_date_str = departure_date.strftime("%Y-%m-%d")
-
-        search_params = {
-            "originLocationCode": origin,
-            "destinationLocationCode": destination,
-            "departureDate": departure_date_str,
-            "adults": adults,
-            "currencyCode": currency_code,
-            "max": max_results,
-        }
-
-        response = amadeus.shopping.flight_offers_search.get(**search_params)
-        return response.data
+        cache_key, search_params = _flight_offers_key(
+            origin, destination, departure_date, adults, currency_code, max_results
+        )
+        return _cached(
+            cache_key,
+            FLIGHT_OFFERS_TTL,
+            lambda: amadeus.shopping.flight_offers_search.get(**search_params).data,
+            refresh=refresh,
+        )
 
     except ResponseError as error:
         handle_amadeus_error(error)
         return []
 
+def flight_offers_expiry(
+    origin: str,
+    destination: str,
+    departure_date: datetime,
+    adults: int,
+    currency_code: str = "INR",
+    max_results: int = 20
+) -> Optional[float]:
+    """Get the remaining cache lifetime of a flight offers search.
+
+    Takes the same search criteria as search_flights.
+
+    Returns:
+        Seconds until the cached offers expire, or None if they are not cached
+    """
+    cache_key, _ = _flight_offers_key(
+        origin, destination, departure_date, adults, currency_code, max_results
+    )
+    return cache.ttl(cache_key)
+
 def get_flight_offer_price(flight_offer: Dict[str, Any]) -> Dict[str, Any]:
     """Get the final price for a flight offer including taxes and fees.
 
@@ -0,0 +1,151 @@
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.config.analytics_config import (
+    ANALYTICS_TOP_K,
+    ANALYTICS_CANDIDATE_FACTOR,
+    ANALYTICS_TRACKER_CAPACITY,
+    ANALYTICS_DECAY,
+    WARM_INTERVAL,
+    WARM_UPSTREAM_QUOTA,
+    WARM_QUOTA_SHARE,
+)
+from app.config.cache_config import cache
+from app.models import PopularRoute
+from app.services import amadeus_service
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (origin, destination, days between search and departure, adults)
+Route = Tuple[str, str, int, int]
+
+WARMER_LEASE_KEY = "analytics:warmer_lease"
+
+class TopKTracker:
+    """Space-Saving top-K counter with a fixed number of slots.
+
+    When every slot is taken, a new route replaces the least counted one and
+    inherits its count, so frequent routes are never undercounted and memory
+    stays bounded regardless of traffic.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._counts: Dict[Route, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, route: Route) -> None:
+        with self._lock:
+            if route in self._counts:
+                self._counts[route] += 1
+            elif len(self._counts) < self.capacity:
+                self._counts[route] = 1
+            else:
+                evicted = min(self._counts, key=self._counts.__getitem__)
+                self._counts[route] = self._counts.pop(evicted) + 1
+
+    def drain(self) -> Dict[Route, int]:
+        """Return the current counts and reset the tracker."""
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+tracker = TopKTracker(ANALYTICS_TRACKER_CAPACITY)
+
+def record_search(origin: str, destination: str, departure_date: datetime, adults: int) -> None:
+    """Count a user flight search towards the popular routes.
+
+    Args:
+        origin: IATA code of the departure airport
+        destination: IATA code of the arrival airport
+        departure_date: Date of departure
+        adults: Number of adult passengers
+    """
+    date_offset = (departure_date.date() - date.today()).days
+    if date_offset >= 0:
+        # Upper-cased like the flight offers cache key, so warming hits user searches
+        tracker.add((origin.upper(), destination.upper(), date_offset, adults))
+
+def flush_route_counts(db: Session) -> None:
+    """Add the in-memory counts to the persisted popular routes.
+
+    The ANALYTICS_TOP_K * ANALYTICS_CANDIDATE_FACTOR most counted routes are
+    kept, so a newly popular route can build up a count before it is warmed.
+    """
+    counts = tracker.drain()
+    if not counts:
+        return
+    now = datetime.now()
+    # Upsert in SQL so flushes from concurrent workers add up instead of racing
+    for (origin, destination, date_offset, adults), count in counts.items():
+        statement = insert(PopularRoute).values(
+            origin=origin,
+            destination=destination,
+            date_offset=date_offset,
+            adults=adults,
+            count=count,
+            updated_at=now,
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=["origin", "destination", "date_offset", "adults"],
+            set_={
+                "count": PopularRoute.count + statement.excluded.count,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ))
+
+    kept = (
+        db.query(PopularRoute.count)
+        .order_by(PopularRoute.count.desc())
+        .offset(ANALYTICS_TOP_K * ANALYTICS_CANDIDATE_FACTOR - 1)
+        .first()
+    )
+    if kept is not None:
+        db.query(PopularRoute).filter(PopularRoute.count < kept.count).delete()
+    db.commit()
+
+def top_routes(db: Session, limit: int = ANALYTICS_TOP_K) -> List[Route]:
+    """Get the most searched routes, most popular first."""
+    rows = db.query(PopularRoute).order_by(PopularRoute.count.desc()).limit(limit).all()
+    return [(row.origin, row.destination, row.date_offset, row.adults) for row in rows]
+
+def warm_popular_routes(db: Session) -> int:
+    """Refresh cached flight offers of popular routes before they expire.
+
+    Flushes this worker's counts, then, if this worker holds the warmer lease,
+    refreshes the top routes whose cached offers are missing or would expire
+    before the next cycle. At most WARM_QUOTA_SHARE of the hourly upstream
+    quota is spent, prorated to WARM_INTERVAL.
+
+    Returns:
+        Number of routes refreshed
+    """
+    flush_route_counts(db)
+    # Only one worker sharing the cache warms per cycle
+    if not cache.add(WARMER_LEASE_KEY, True, WARM_INTERVAL * 0.9):
+        return 0
+
+    budget = int(WARM_UPSTREAM_QUOTA * WARM_QUOTA_SHARE * WARM_INTERVAL / 3600)
+    refreshed = 0
+    for origin, destination, date_offset, adults in top_routes(db):
+        if refreshed >= budget:
+            break
+        departure_date = datetime.combine(date.today() + timedelta(days=date_offset), datetime.min.time())
+        remaining = amadeus_service.flight_offers_expiry(origin, destination, departure_date, adults)
+        if remaining is not None and remaining > WARM_INTERVAL:
+            continue
+        try:
+            amadeus_service.search_flights(origin, destination, departure_date, adults, refresh=True)
+        except HTTPException as error:
+            logger.warning("Could not warm %s to %s on %s: %s", origin, destination, departure_date.date(), error.detail)
+        refreshed += 1
+
+    db.query(PopularRoute).update({PopularRoute.count: PopularRoute.count * ANALYTICS_DECAY})
+    db.commit()
+    return refreshed
@@ -0,0 +1,380 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.packed_offers import PackedOffers, pack_offers
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def make_key(namespace: str, params: Dict[str, Any]) -> str:
+    """Build a stable cache key from a namespace and request parameters.
+
+    Args:
+        namespace: Logical group of the cached data (e.g., "flight_offers")
+        params: Parameters that identify the upstream request
+
+    Returns:
+        Cache key string
+    """
+    return f"{namespace}:{json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)}"
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as zlib-compressed compact JSON."""
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _loads(payload: bytes) -> Any:
+    """Decode a value previously encoded with _dumps."""
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+class CacheBackend(ABC):
+    """Interface shared by all cache backends.
+
+    Values must be JSON-serializable. Every entry has a TTL in seconds and
+    backends evict the least recently used entries once max_entries is
+    exceeded.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+
+    @abstractmethod
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Store value under key for ttl seconds only if key is missing or expired.
+
+        The check and the write are atomic across every process sharing the
+        backend, so add can be used as a lease.
+
+        Returns:
+            True if the value was stored
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+
+    @abstractmethod
+    def ttl(self, key: str) -> Optional[float]:
+        """Return the remaining lifetime of key in seconds, or None if missing."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+
+class MemoryCache(CacheBackend):
+    """Per-process LRU cache. Not shared between uvicorn workers.
+
+    Lists (flight offers and other Amadeus results) are held packed, which
+    shares repeated strings and nested objects, and unpacked on every hit.
+    Backends that serialize values don't need this: zlib already removes the
+    repetition from what they store.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return value.unpack() if isinstance(value, PackedOffers) else value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if isinstance(value, list):
+            value = pack_offers(value)
+        with self._lock:
+            self._set_locked(key, value, ttl)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        if isinstance(value, list):
+            value = pack_offers(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                return False
+            self._set_locked(key, value, ttl)
+            return True
+
+    def _set_locked(self, key: str, value: Any, ttl: float) -> None:
+        """Store an already packed value. The caller must hold self._lock."""
+        self._entries[key] = (value, time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def ttl(self, key: str) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[1] - time.time()
+        return remaining if remaining > 0 else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """LRU cache stored in a SQLite file shared by every process on the host.
+
+    The database runs in WAL mode so concurrent readers in other uvicorn
+    workers are not blocked by writers. Each thread gets its own connection.
+    LRU order is approximate: a hit only records its access time when the
+    previous one is older than TOUCH_INTERVAL seconds, so most reads never
+    take the write lock. Expired rows are removed by writers.
+    """
+
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                return None
+            if now - row[2] > self.TOUCH_INTERVAL:
+                conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return _loads(row[0])
+        except sqlite3.Error as error:
+            logger.warning("Cache read failed for %s: %s", key, error)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, _dumps(value), now + ttl, now),
+            )
+            self._evict(conn, now)
+        except sqlite3.Error as error:
+            logger.warning("Cache write failed for %s: %s", key, error)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                """
+                DELETE FROM cache_entries WHERE key IN (
+                    SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?
+                )
+                """,
+                (count - self.max_entries,),
+            )
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        now = time.time()
+        try:
+            cursor = self._connection().execute(
+                """
+                INSERT INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+                WHERE cache_entries.expires_at <= ?
+                """,
+                (key, _dumps(value), now + ttl, now, now),
+            )
+            return cursor.rowcount == 1
+        except sqlite3.Error as error:
+            logger.warning("Cache write failed for %s: %s", key, error)
+            return False
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error as error:
+            logger.warning("Cache delete failed for %s: %s", key, error)
+
+    def ttl(self, key: str) -> Optional[float]:
+        try:
+            row = self._connection().execute(
+                "SELECT expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as error:
+            logger.warning("Cache read failed for %s: %s", key, error)
+            return None
+        if row is None:
+            return None
+        remaining = row[0] - time.time()
+        return remaining if remaining > 0 else None
+
+    def clear(self) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache_entries")
+        except sqlite3.Error as error:
+            logger.warning("Cache clear failed: %s", error)
+
+
+class RedisCache(CacheBackend):
+    """LRU cache backed by any Redis-compatible server, for multi-node deployments.
+
+    TTLs are enforced by the server. The LRU size cap is tracked in a sorted
+    set of access times so it holds even when the server has no maxmemory
+    policy configured.
+    """
+
+    def __init__(self, url: str, max_entries: int, prefix: str = "flight-agent:"):
+        try:
+            import redis
+        except ImportError as error:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from error
+
+        self.client = redis.Redis.from_url(url)
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._index = f"{prefix}__lru__"
+        self._error = redis.RedisError
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            payload = self.client.get(self.prefix + key)
+            if payload is None:
+                self.client.zrem(self._index, key)
+                return None
+            self.client.zadd(self._index, {key: time.time()})
+            return _loads(payload)
+        except self._error as error:
+            logger.warning("Cache read failed for %s: %s", key, error)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(self.prefix + key, _dumps(value), px=max(1, int(ttl * 1000)))
+            pipe.zadd(self._index, {key: time.time()})
+            pipe.zcard(self._index)
+            count = pipe.execute()[-1]
+            if count > self.max_entries:
+                evicted = self.client.zpopmin(self._index, count - self.max_entries)
+                if evicted:
+                    self.client.delete(*(self.prefix + name.decode("utf-8") for name, _ in evicted))
+        except self._error as error:
+            logger.warning("Cache write failed for %s: %s", key, error)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        try:
+            added = self.client.set(
+                self.prefix + key, _dumps(value), px=max(1, int(ttl * 1000)), nx=True
+            )
+            if added:
+                self.client.zadd(self._index, {key: time.time()})
+            return bool(added)
+        except self._error as error:
+            logger.warning("Cache write failed for %s: %s", key, error)
+            return False
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+            self.client.zrem(self._index, key)
+        except self._error as error:
+            logger.warning("Cache delete failed for %s: %s", key, error)
+
+    def ttl(self, key: str) -> Optional[float]:
+        try:
+            remaining = self.client.pttl(self.prefix + key)
+        except self._error as error:
+            logger.warning("Cache read failed for %s: %s", key, error)
+            return None
+        return remaining / 1000 if remaining > 0 else None
+
+    def clear(self) -> None:
+        try:
+            names = self.client.zrange(self._index, 0, -1)
+            if names:
+                self.client.delete(*(self.prefix + name.decode("utf-8") for name in names))
+            self.client.delete(self._index)
+        except self._error as error:
+            logger.warning("Cache clear failed: %s", error)
+
+
+def create_cache(backend: str, url: str, max_entries: int) -> CacheBackend:
+    """Create a cache backend by name.
+
+    Args:
+        backend: One of "sqlite", "redis" or "memory"
+        url: SQLite file path for "sqlite", server URL for "redis", ignored for "memory"
+        max_entries: Maximum number of entries kept before LRU eviction
+
+    Returns:
+        Configured cache backend. Falls back to a MemoryCache if the SQLite
+        file cannot be opened
+    """
+    if backend == "sqlite":
+        try:
+            return SQLiteCache(url, max_entries)
+        except sqlite3.Error as error:
+            # e.g. a read-only filesystem: keep serving with a per-process cache
+            logger.warning("Cannot open SQLite cache at %s (%s), using a memory cache", url, error)
+            return MemoryCache(max_entries)
+    if backend == "redis":
+        return RedisCache(url, max_entries)
+    if backend == "memory":
+        return MemoryCache(max_entries)
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,299 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.config.cache_config import cache
+from app.config.inspiration_config import (
+    INSPIRATION_REFRESH_INTERVAL,
+    INSPIRATION_DATE_STEP,
+    INSPIRATION_MAX_WORKERS,
+    INSPIRATION_MAX_FAILURE_SHARE,
+    INSPIRATION_REFRESH_CHECK_INTERVAL,
+    INSPIRATION_REBUILD_LEASE,
+    INSPIRATION_MAX_SEARCHES,
+)
+from app.models import InspirationFare, InspirationRefresh
+from app.services import flight_service
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REFRESHER_LEASE_KEY = "inspiration:refresher_lease"
+REBUILD_LEASE_KEY = "inspiration:rebuild:{origin}:{month}"
+
+# Delays in seconds before retrying a search rejected with 429 Too Many Requests
+RATE_LIMIT_BACKOFF = (1.0, 2.0, 4.0)
+
+def parse_month(month: str) -> date:
+    """Parse a YYYY-MM string into the first day of that month.
+
+    Raises:
+        ValueError: If month is not a valid YYYY-MM string or is before the current month
+    """
+    first_day = datetime.strptime(month, "%Y-%m").date()
+    if first_day < date.today().replace(day=1):
+        raise ValueError(f"Month {month} is in the past")
+    return first_day
+
+def next_month() -> str:
+    """Return the calendar month after the current one as YYYY-MM."""
+    first_of_month = date.today().replace(day=1)
+    return (first_of_month + timedelta(days=32)).strftime("%Y-%m")
+
+def _departure_dates(month: str) -> List[date]:
+    """Sample departure dates across the remaining days of a month."""
+    start = parse_month(month)
+    end = (start + timedelta(days=32)).replace(day=1)
+    current = max(start, date.today())
+    dates = []
+    while current < end:
+        dates.append(current)
+        current += timedelta(days=INSPIRATION_DATE_STEP)
+    return dates
+
+def _cheapest_offer(
+    origin: str,
+    destination: str,
+    departure_date: date,
+) -> Optional[Tuple[float, str]]:
+    """Return the (price, currency) of the cheapest offer for one route and date.
+
+    Searches rejected with 429 are retried with backoff.
+
+    Raises:
+        HTTPException: If the search still fails
+    """
+    for delay in (*RATE_LIMIT_BACKOFF, None):
+        try:
+            offers = flight_service.search_flights(
+                origin=origin,
+                destination=destination,
+                departure_date=datetime.combine(departure_date, datetime.min.time()),
+                adults=1,
+            )
+            break
+        except HTTPException as error:
+            if error.status_code != status.HTTP_429_TOO_MANY_REQUESTS or delay is None:
+                raise
+            time.sleep(delay)
+    prices = [
+        (float(offer["price"]["grandTotal"]), offer["price"]["currency"])
+        for offer in offers
+        if "price" in offer
+    ]
+    return min(prices) if prices else None
+
+def _search_route(origin: str, destination: str, departure_date: date) -> Tuple[bool, Optional[Tuple[float, str]]]:
+    """Run _cheapest_offer, returning (succeeded, result) instead of raising."""
+    try:
+        return True, _cheapest_offer(origin, destination, departure_date)
+    except HTTPException as error:
+        logger.warning(
+            "Search failed for %s to %s on %s: %s", origin, destination, departure_date, error.detail
+        )
+        return False, None
+
+def refresh_inspiration(db: Session, origin: str, month: str) -> List[InspirationFare]:
+    """Rebuild the materialized cheapest-destinations table for (origin, month).
+
+    Flight searches for every direct destination and sampled departure date
+    run concurrently and go through the shared response cache. At most
+    INSPIRATION_MAX_SEARCHES are run, earliest dates first so every
+    destination is covered. The refresh is discarded if more than
+    INSPIRATION_MAX_FAILURE_SHARE of them fail.
+
+    Args:
+        db: Database session
+        origin: IATA code of the origin airport
+        month: Month to search as YYYY-MM
+
+    Returns:
+        The refreshed rows, cheapest first
+
+    Raises:
+        HTTPException(503): If too many flight searches failed
+    """
+    destinations = {
+        destination["iataCode"]: destination.get("name")
+        for destination in flight_service.get_flight_destinations(origin)
+        if destination.get("iataCode")
+    }
+    routes = [
+        (destination, departure_date)
+        for departure_date in _departure_dates(month)
+        for destination in destinations
+    ]
+    if len(routes) > INSPIRATION_MAX_SEARCHES:
+        logger.warning(
+            "Limiting inspiration refresh for %s in %s to %d of %d searches",
+            origin, month, INSPIRATION_MAX_SEARCHES, len(routes),
+        )
+        routes = routes[:INSPIRATION_MAX_SEARCHES]
+    logger.info("Refreshing inspiration for %s in %s: %d searches", origin, month, len(routes))
+
+    failures = 0
+    cheapest: Dict[str, Tuple[float, str, date]] = {}
+    with ThreadPoolExecutor(max_workers=INSPIRATION_MAX_WORKERS) as executor:
+        results = executor.map(lambda route: _search_route(origin, *route), routes)
+        for (destination, departure_date), (succeeded, result) in zip(routes, results):
+            if not succeeded:
+                failures += 1
+                continue
+            if result is None:
+                continue
+            price, currency = result
+            if destination not in cheapest or price < cheapest[destination][0]:
+                cheapest[destination] = (price, currency, departure_date)
+
+    if routes and failures > INSPIRATION_MAX_FAILURE_SHARE * len(routes):
+        logger.error(
+            "Discarding inspiration refresh for %s in %s: %d of %d searches failed",
+            origin, month, failures, len(routes),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many flight searches failed, try again later",
+        )
+
+    refreshed_at = datetime.now()
+    fares = [
+        InspirationFare(
+            origin=origin,
+            month=month,
+            destination=destination,
+            destination_name=destinations[destination],
+            departure_date=departure_date,
+            price=price,
+            currency=currency,
+            refreshed_at=refreshed_at,
+        )
+        for destination, (price, currency, departure_date) in cheapest.items()
+    ]
+    db.query(InspirationFare).filter(
+        InspirationFare.origin == origin,
+        InspirationFare.month == month,
+    ).delete()
+    db.add_all(fares)
+    db.execute(
+        insert(InspirationRefresh)
+        .values(origin=origin, month=month, refreshed_at=refreshed_at)
+        .on_conflict_do_update(
+            index_elements=["origin", "month"],
+            set_={"refreshed_at": refreshed_at},
+        )
+    )
+    db.commit()
+    return sorted(fares, key=lambda fare: fare.price)
+
+def get_cheapest_destinations(
+    db: Session,
+    origin: str,
+    month: str,
+    limit: int = 20,
+) -> List[Dict[str, Any]]:
+    """Get the cheapest direct destinations from an origin within a month.
+
+    Reads the materialized table for (origin, month) and only rebuilds it
+    when it is missing or older than INSPIRATION_REFRESH_INTERVAL. Only one
+    caller rebuilds a given (origin, month) at a time; the others, and callers
+    whose rebuild fails, get the previous rows.
+
+    Args:
+        db: Database session
+        origin: IATA code of the origin airport
+        month: Month to search as YYYY-MM
+        limit: Maximum number of destinations to return
+
+    Returns:
+        List of destinations with their cheapest one-adult fare, cheapest first
+
+    Raises:
+        HTTPException(503): If there are no previous rows and the rebuild failed
+            or is running elsewhere
+    """
+    refresh = db.get(InspirationRefresh, (origin, month))
+    fares = (
+        db.query(InspirationFare)
+        .filter(InspirationFare.origin == origin, InspirationFare.month == month)
+        .order_by(InspirationFare.price)
+        .limit(limit)
+        .all()
+    )
+    stale_before = datetime.now() - timedelta(seconds=INSPIRATION_REFRESH_INTERVAL)
+    if refresh is None or refresh.refreshed_at < stale_before:
+        lease_key = REBUILD_LEASE_KEY.format(origin=origin, month=month)
+        if cache.add(lease_key, True, INSPIRATION_REBUILD_LEASE):
+            try:
+                fares = refresh_inspiration(db, origin, month)[:limit]
+            except HTTPException:
+                db.rollback()
+                if not fares:
+                    raise
+                logger.warning("Serving stale inspiration for %s in %s", origin, month)
+            finally:
+                cache.delete(lease_key)
+        elif refresh is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Fares for this month are being fetched, try again shortly",
+            )
+
+    return [
+        {
+            "origin": fare.origin,
+            "destination": fare.destination,
+            "destinationName": fare.destination_name,
+            "departureDate": fare.departure_date.isoformat(),
+            "price": fare.price,
+            "currency": fare.currency,
+            "refreshedAt": fare.refreshed_at.isoformat(),
+        }
+        for fare in fares
+    ]
+
+def refresh_stale_inspirations(db: Session) -> int:
+    """Rebuild every materialized (origin, month) table that goes stale before the next check.
+
+    Meant to run every INSPIRATION_REFRESH_CHECK_INTERVAL, so tables are
+    rebuilt here rather than on the request path. Only one worker sharing the
+    cache runs it per interval. Tables for months that have already ended are
+    dropped instead.
+
+    Returns:
+        Number of tables refreshed
+    """
+    if not cache.add(REFRESHER_LEASE_KEY, True, INSPIRATION_REFRESH_CHECK_INTERVAL * 0.9):
+        return 0
+
+    stale_before = datetime.now() - timedelta(
+        seconds=INSPIRATION_REFRESH_INTERVAL - INSPIRATION_REFRESH_CHECK_INTERVAL
+    )
+    current_month = date.today().strftime("%Y-%m")
+    db.query(InspirationFare).filter(InspirationFare.month < current_month).delete()
+    db.query(InspirationRefresh).filter(InspirationRefresh.month < current_month).delete()
+    db.commit()
+
+    stale = (
+        db.query(InspirationRefresh.origin, InspirationRefresh.month)
+        .filter(InspirationRefresh.refreshed_at < stale_before)
+        .all()
+    )
+    refreshed = 0
+    for origin, month in stale:
+        lease_key = REBUILD_LEASE_KEY.format(origin=origin, month=month)
+        if not cache.add(lease_key, True, INSPIRATION_REBUILD_LEASE):
+            continue
+        try:
+            refresh_inspiration(db, origin, month)
+            refreshed += 1
+        except HTTPException as error:
+            db.rollback()
+            logger.warning("Could not refresh inspiration for %s in %s: %s", origin, month, error.detail)
+        finally:
+            cache.delete(lease_key)
+    return refreshed
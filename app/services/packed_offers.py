@@ -0,0 +1,100 @@
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# Low-cardinality fields whose values are interned process-wide. Interned
+# strings are never freed, so unique values (timestamps, ids, prices) are
+# only shared within one packed result.
+INTERNED_FIELDS = frozenset({
+    "carrierCode",
+    "iataCode",
+    "terminal",
+    "code",
+    "fareBasis",
+    "brandedFare",
+    "brandedFareLabel",
+    "cabin",
+    "class",
+    "currency",
+    "validatingAirlineCodes",
+})
+
+class _Record:
+    """A JSON object packed as a shared key tuple and a tuple of packed values."""
+    __slots__ = ("keys", "values")
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]):
+        self.keys = keys
+        self.values = values
+
+class PackedOffers:
+    """Compact, deduplicated representation of a flight offers search result.
+
+    Amadeus offers repeat the same carrier, aircraft and airport codes, fare
+    basis strings and nested objects (segments, prices, fare details, amenities)
+    many times over. Packing interns keys and INTERNED_FIELDS values, stores
+    every other repeated string once per result, shares one key tuple per
+    object shape and stores identical nested objects once, whichever offer
+    they appear in. Objects become _Record instances and lists become tuples.
+
+    Use pack_offers to build one and unpack to get the original dicts back.
+    Only the in-process memory cache holds this form.
+    """
+    __slots__ = ("offers",)
+
+    def __init__(self, offers: Tuple[_Record, ...]):
+        self.offers = offers
+
+    def unpack(self) -> List[Dict[str, Any]]:
+        """Rebuild the flight offers as plain dictionaries."""
+        return [_unpack(offer) for offer in self.offers]
+
+    def __len__(self) -> int:
+        return len(self.offers)
+
+class _Packer:
+    """Packs JSON values, sharing every identical string, shape and nested object."""
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._shapes: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        # Children are already canonical, so a container is identified by
+        # the ids of its items; ids also keep 1, 1.0 and True apart.
+        self._containers: Dict[Tuple[Any, ...], Any] = {}
+
+    def pack(self, value: Any, field: Optional[str] = None) -> Any:
+        if isinstance(value, str):
+            if field in INTERNED_FIELDS:
+                return sys.intern(value)
+            return self._strings.setdefault(value, value)
+        if isinstance(value, dict):
+            keys = tuple(sys.intern(key) for key in value)
+            keys = self._shapes.setdefault(keys, keys)
+            values = tuple(self.pack(item, key) for key, item in zip(keys, value.values()))
+            identity = (id(keys), *map(id, values))
+            record = self._containers.get(identity)
+            if record is None:
+                record = self._containers[identity] = _Record(keys, values)
+            return record
+        if isinstance(value, list):
+            items = tuple(self.pack(item, field) for item in value)
+            return self._containers.setdefault((None, *map(id, items)), items)
+        return value
+
+def pack_offers(offers: List[Dict[str, Any]]) -> PackedOffers:
+    """Pack a flight offers search result, or any other list of JSON objects.
+
+    Args:
+        offers: Flight offer dictionaries as returned by the Amadeus API
+
+    Returns:
+        Packed offers sharing repeated strings and nested objects
+    """
+    packer = _Packer()
+    return PackedOffers(tuple(packer.pack(offer) for offer in offers))
+
+def _unpack(value: Any) -> Any:
+    if type(value) is _Record:
+        return {key: _unpack(item) for key, item in zip(value.keys, value.values)}
+    if type(value) is tuple:
+        return [_unpack(item) for item in value]
+    return value
@@ -0,0 +1,57 @@
+"""Memory benchmark for cached flight offers: plain dicts vs PackedOffers.
+
+Loads every fixture in benchmarks/fixtures once, each a search for a
+different route and date, and reports the process memory per cached offer,
+as held by the memory cache backend, and the encoded size stored by the
+SQLite and Redis backends, per fixture and across all of them.
+
+Run from the repository root:
+    python -m benchmarks.offer_memory
+"""
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+
+from app.services.cache_service import _dumps
+from app.services.packed_offers import pack_offers
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+def measure(build):
+    """Return the bytes still allocated by the objects build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+def compare(raw_searches):
+    """Return (offers, dict bytes, packed bytes, encoded bytes) for the searches."""
+    offer_count = sum(len(json.loads(raw)) for raw in raw_searches)
+    dict_bytes, searches = measure(lambda: [json.loads(raw) for raw in raw_searches])
+    packed_bytes, packed = measure(lambda: [pack_offers(json.loads(raw)) for raw in raw_searches])
+    assert [search.unpack() for search in packed] == searches
+    encoded_bytes = sum(len(_dumps(search)) for search in searches)
+    return offer_count, dict_bytes, packed_bytes, encoded_bytes
+
+def report(name, offer_count, dict_bytes, packed_bytes, encoded_bytes):
+    print(
+        f"{name:<28} {offer_count:>6} {dict_bytes / offer_count:>8.0f} "
+        f"{packed_bytes / offer_count:>8.0f} {dict_bytes / packed_bytes:>7.1f}x "
+        f"{encoded_bytes / offer_count:>8.0f}"
+    )
+
+def main():
+    fixtures = sorted(FIXTURES.glob("*.json"))
+    raw_searches = [path.read_text() for path in fixtures]
+
+    print("B/offer                      offers    dicts   packed   saving  encoded")
+    for path, raw in zip(fixtures, raw_searches):
+        report(path.stem, *compare([raw]))
+    report(f"all {len(fixtures)} searches", *compare(raw_searches))
+
+if __name__ == "__main__":
+    main()
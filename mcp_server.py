@@ -1,8 +1,21 @@
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Literal
+import anyio
 from mcp.server.fastmcp import FastMCP
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.services import flight_service
+from app import models  # noqa: F401 - registers tables on Base
+from app.database import Base, SessionLocal, engine
+from app.services import analytics_service, flight_service, inspiration_service
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# The MCP server can run without app.main, so create the tables its tools use
+try:
+    Base.metadata.create_all(bind=engine)
+except SQLAlchemyError as error:
+    logger.warning("Could not create database tables: %s", error)
 
 # Create a FastMCP instance
 mcp = FastMCP("Flight Booking MCP Server")
@@ -27,6 +40,35 @@ def get_flight_destinations(origin: str) -> List[Dict[str, Any]]:
     """
     return flight_service.get_flight_destinations(origin)
 
+def _get_cheapest_destinations(origin: str, month: str, limit: int) -> List[Dict[str, Any]]:
+    db = SessionLocal()
+    try:
+        return inspiration_service.get_cheapest_destinations(db, origin, month, limit)
+    finally:
+        db.close()
+
+@mcp.tool()
+async def get_cheapest_destinations(
+    origin: str,
+    month: Optional[str] = None,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Get the cheapest direct destinations from an origin airport IATA code (e.g., 'BOM') within a month.
+    Month is given as YYYY-MM and defaults to next month. Prices are for one adult.
+    Returns one fare per destination with its departure date, sorted by price.
+    Returns empty list if the month is invalid or in the past. Use search_flights for live offers on a chosen route.
+    """
+    month = month or inspiration_service.next_month()
+    try:
+        inspiration_service.parse_month(month)
+    except ValueError:
+        return []
+    # A rebuild runs many flight searches; keep it off the event loop
+    return await anyio.to_thread.run_sync(
+        _get_cheapest_destinations, origin.upper(), month, limit
+    )
+
 @mcp.tool()
 def search_flights(
     origin: str,
@@ -41,6 +83,7 @@ def search_flights(
     """
     if adults < 1 or adults > 9:
         return []
+    analytics_service.record_search(origin, destination, departure_date, adults)
     return flight_service.search_flights(
         origin=origin,
         destination=destination,
@@ -0,0 +1,6 @@
+import os
+
+# Importing the services configures the Amadeus client and the shared cache
+os.environ.setdefault("AMADEUS_CLIENT_ID", "test")
+os.environ.setdefault("AMADEUS_CLIENT_SECRET", "test")
+os.environ.setdefault("CACHE_BACKEND", "memory")
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.database import Base
+from app.services import analytics_service
+from app.services.analytics_service import TopKTracker
+
+
+def test_tracker_counts_routes():
+    tracker = TopKTracker(capacity=3)
+    for route in [("BOM", "DEL", 1, 1)] * 3 + [("BOM", "GOI", 2, 1)]:
+        tracker.add(route)
+    assert tracker.drain() == {("BOM", "DEL", 1, 1): 3, ("BOM", "GOI", 2, 1): 1}
+    assert tracker.drain() == {}
+
+
+def test_tracker_replaces_least_counted_route_when_full():
+    tracker = TopKTracker(capacity=2)
+    for route in ["A", "A", "A", "B", "C"]:
+        tracker.add(route)
+    # C takes B's slot and inherits its count, so it is never undercounted
+    assert tracker.drain() == {"A": 3, "C": 2}
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_concurrent_flushes_add_up(session_factory, monkeypatch):
+    first, second = session_factory(), session_factory()
+    route = ("BOM", "DEL", 3, 1)
+    for db, count in ((first, 5), (second, 3), (first, 4)):
+        tracker = TopKTracker(capacity=10)
+        for _ in range(count):
+            tracker.add(route)
+        monkeypatch.setattr(analytics_service, "tracker", tracker)
+        analytics_service.flush_route_counts(db)
+
+    row = session_factory().get(models.PopularRoute, route)
+    assert row.count == 12
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from app.services.cache_service import MemoryCache, SQLiteCache, create_cache
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def cache(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteCache(str(tmp_path / "cache.db"), max_entries=3)
+    return MemoryCache(max_entries=3)
+
+
+def test_get_returns_stored_value(cache):
+    cache.set("key", {"offers": [1, 2]}, ttl=10)
+    assert cache.get("key") == {"offers": [1, 2]}
+    assert 0 < cache.ttl("key") <= 10
+
+
+def test_expired_entries_are_not_returned(cache):
+    cache.set("key", "value", ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get("key") is None
+    assert cache.ttl("key") is None
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    for index in range(3):
+        cache.set(f"key{index}", index, ttl=10)
+        time.sleep(0.01)
+    cache.set("key3", 3, ttl=10)
+    assert cache.get("key0") is None
+    assert [cache.get(f"key{index}") for index in range(1, 4)] == [1, 2, 3]
+
+
+def test_add_only_stores_missing_or_expired_keys(cache):
+    assert cache.add("lease", "first", ttl=0.05)
+    assert not cache.add("lease", "second", ttl=10)
+    assert cache.get("lease") == "first"
+    time.sleep(0.1)
+    assert cache.add("lease", "third", ttl=10)
+    assert cache.get("lease") == "third"
+
+
+def test_add_grants_a_lease_to_a_single_thread(cache, tmp_path):
+    if isinstance(cache, SQLiteCache):
+        # One cache object per thread, like separate worker processes
+        caches = [SQLiteCache(cache.path, max_entries=3) for _ in range(8)]
+    else:
+        caches = [cache] * 8
+    barrier = threading.Barrier(len(caches))
+    winners = []
+
+    def acquire(worker_cache, worker_id):
+        barrier.wait()
+        if worker_cache.add("lease", worker_id, ttl=10):
+            winners.append(worker_id)
+
+    threads = [threading.Thread(target=acquire, args=(c, i)) for i, c in enumerate(caches)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(winners) == 1
+
+
+def test_memory_cache_round_trips_lists():
+    cache = MemoryCache(max_entries=3)
+    offers = [{"id": "1", "price": {"total": "10.00"}}, {"id": "2", "price": {"total": "10.00"}}]
+    cache.set("offers", offers, ttl=10)
+    assert cache.get("offers") == offers
+
+
+def test_unwritable_sqlite_path_falls_back_to_memory(tmp_path):
+    cache = create_cache("sqlite", str(tmp_path / "missing" / "cache.db"), max_entries=3)
+    assert isinstance(cache, MemoryCache)
@@ -0,0 +1,42 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.services.packed_offers import pack_offers
+
+FIXTURES = sorted((Path(__file__).parent.parent / "benchmarks" / "fixtures").glob("*.json"))
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.stem)
+def test_unpack_returns_original_offers(path):
+    offers = json.loads(path.read_text())
+    packed = pack_offers(offers)
+    assert len(packed) == len(offers)
+    assert packed.unpack() == offers
+
+
+def test_equal_numbers_and_booleans_stay_distinct():
+    offers = [{"a": 1}, {"a": 1.0}, {"a": True}, {"a": [1]}, {"a": [1.0]}, {"a": [True]}]
+    unpacked = pack_offers(offers).unpack()
+    assert [type(offer["a"]) for offer in unpacked[:3]] == [int, float, bool]
+    assert [type(offer["a"][0]) for offer in unpacked[3:]] == [int, float, bool]
+
+
+def test_identical_nested_objects_are_stored_once():
+    segment = {"carrierCode": "AI", "number": "101", "aircraft": {"code": "32A"}}
+    offers = [
+        {"id": "1", "segments": [dict(segment)]},
+        {"id": "2", "segments": [dict(segment)]},
+    ]
+    first, second = pack_offers(offers).offers
+    assert first.keys is second.keys
+    assert first.values[1] is second.values[1]
+
+
+def test_only_low_cardinality_fields_are_interned():
+    packed = pack_offers([{"carrierCode": "".join(["Z", "9"]), "at": "".join(["2025-04-10", "T06:00:00"])}])
+    carrier, timestamp = packed.offers[0].values
+    assert sys.intern("".join(["Z", "9"])) is carrier
+    assert sys.intern("".join(["2025-04-10", "T06:00:00"])) is not timestamp